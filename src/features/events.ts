@@ -207,48 +207,80 @@ export async function enrichEvent(
   parts.push(`🫘 Sounds like a plan! Here's what I found for ${activityLabel}${when ? ` (${when})` : ''}:`);
   parts.push('');
 
-  // Weather enrichment
+  // Weather, transit, and AI enrichment hit three independent backends, so
+  // fire them concurrently and assemble in order — the response takes the
+  // slowest call instead of the sum of all three. Each helper swallows its
+  // own failure so one flaky backend never drops the other sections.
   const weatherQuery = buildWeatherQuery(event);
-  if (weatherQuery && config.GOOGLE_API_KEY) {
-    try {
-      const weather = await handleWeather(weatherQuery);
-      // Extract just the key info (first 3 lines of weather response)
-      const weatherLines = weather.split('\n').filter((l) => l.trim()).slice(0, 3);
-      parts.push(`${bold('Weather')}: ${weatherLines.join(' | ')}`);
-    } catch (err) {
-      logger.warn({ err, weatherQuery, groupJid, senderJid }, 'Weather enrichment failed for event');
-    }
+  const [weather, transit, ai] = await Promise.all([
+    weatherQuery && config.GOOGLE_API_KEY
+      ? fetchWeatherSection(weatherQuery, senderJid, groupJid)
+      : null,
+    where && config.MBTA_API_KEY
+      ? fetchTransitSection(where, senderJid, groupJid)
+      : null,
+    fetchAISection(event, senderJid, groupJid),
+  ]);
+
+  if (weather) parts.push(weather);
+  if (transit) parts.push(transit);
+  if (ai) {
+    parts.push('');
+    parts.push(ai);
   }
 
-  // Transit enrichment
-  if (where && config.MBTA_API_KEY) {
-    try {
-      const transit = await handleTransit(`transit to ${where}`);
-      // Just grab the alert summary if any
-      const transitLines = transit.split('\n').filter((l) => l.trim()).slice(0, 3);
-      parts.push(`${bold('Transit')}: ${transitLines.join(' | ')}`);
-    } catch (err) {
-      logger.warn({ err, where, groupJid, senderJid }, 'Transit enrichment failed for event');
-    }
+  return parts.join('\n');
+}
+
+async function fetchWeatherSection(
+  weatherQuery: string,
+  senderJid: string,
+  groupJid: string,
+): Promise<string | null> {
+  try {
+    const weather = await handleWeather(weatherQuery);
+    // Extract just the key info (first 3 lines of weather response)
+    const weatherLines = weather.split('\n').filter((l) => l.trim()).slice(0, 3);
+    return `${bold('Weather')}: ${weatherLines.join(' | ')}`;
+  } catch (err) {
+    logger.warn({ err, weatherQuery, groupJid, senderJid }, 'Weather enrichment failed for event');
+    return null;
+  }
+}
+
+async function fetchTransitSection(
+  where: string,
+  senderJid: string,
+  groupJid: string,
+): Promise<string | null> {
+  try {
+    const transit = await handleTransit(`transit to ${where}`);
+    // Just grab the alert summary if any
+    const transitLines = transit.split('\n').filter((l) => l.trim()).slice(0, 3);
+    return `${bold('Transit')}: ${transitLines.join(' | ')}`;
+  } catch (err) {
+    logger.warn({ err, where, groupJid, senderJid }, 'Transit enrichment failed for event');
+    return null;
   }
+}
 
+async function fetchAISection(
+  event: EventDetails,
+  senderJid: string,
+  groupJid: string,
+): Promise<string | null> {
   // AI summary — logistics tips, suggestions, vibe check
   const aiPrompt = buildEventAIPrompt(event);
   try {
-    const aiResponse = await getAIResponse(aiPrompt, {
+    return await getAIResponse(aiPrompt, {
       groupName: 'Events',
       groupJid,
       senderJid,
     });
-    if (aiResponse) {
-      parts.push('');
-      parts.push(aiResponse);
-    }
   } catch (err) {
     logger.warn({ err, groupJid, senderJid }, 'AI enrichment failed for event');
+    return null;
   }
-
-  return parts.join('\n');
 }
 
 function buildWeatherQuery(event: EventDetails): string | null {
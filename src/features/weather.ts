@@ -1,3 +1,4 @@
+import { lookup } from 'node:dns/promises';
 import { z } from 'zod';
 import { logger } from '../middleware/logger.js';
 import { config } from '../utils/config.js';
@@ -12,7 +13,9 @@ import { bold } from '../utils/formatting.js';
 
 const WEATHER_BASE = 'https://weather.googleapis.com/v1';
 const GEOCODING_BASE = 'https://maps.googleapis.com/maps/api/geocode/json';
-const TIMEOUT_MS = 10_000;
+// Fail fast: a stalled Google call should degrade this one reply, not hold
+// the message pipeline — weather is never worth a long wait
+const TIMEOUT_MS = 5_000;
 
 /**
  * Send the Google API key in a header instead of the URL query string so it does
@@ -22,9 +25,40 @@ function googleApiHeaders(): Record<string, string> {
   return { 'X-Goog-Api-Key': config.GOOGLE_API_KEY ?? '' };
 }
 
+/**
+ * Single request path for the weather + geocoding endpoints. Node's global
+ * fetch keeps a per-origin keep-alive pool, so routing every call through one
+ * helper lets a geocode followed by a weather lookup reuse the warm TLS
+ * connection instead of paying a fresh handshake per call.
+ */
+async function googleGet(url: string): Promise<Response> {
+  return fetch(url, { headers: googleApiHeaders(), signal: AbortSignal.timeout(TIMEOUT_MS) });
+}
+
+// Best-effort DNS warm-up at startup: resolving both Google hosts ahead of
+// the first real query primes the OS resolver cache so the cold path doesn't
+// stack a resolver wait on top of the TLS handshake. Fire-and-forget — a
+// failure here just means the first fetch resolves on its own.
+if (config.GOOGLE_API_KEY) {
+  for (const host of ['weather.googleapis.com', 'maps.googleapis.com']) {
+    void lookup(host).catch(() => undefined);
+  }
+}
+
 // Boston, MA — default location
 const BOSTON = { lat: 42.3601, lng: -71.0589, name: 'Boston' };
 
+// Known-place fast path: many spellings map onto one canonical entry, so the
+// geocoder is reserved for places we genuinely don't know. Keys must be in
+// locationKey() normalized form. Adding a city is a row here, not a regex.
+const LOCATION_ALIASES: Record<string, Coords> = {
+  'boston': BOSTON,
+  'boston ma': BOSTON,
+  'boston, ma': BOSTON,
+  'boston massachusetts': BOSTON,
+  'boston, massachusetts': BOSTON,
+};
+
 // ── Zod schemas (runtime validation for external API responses) ─────
 
 interface Coords { lat: number; lng: number; name: string }
@@ -93,6 +127,17 @@ function conditionEmoji(type: string): string {
   return CONDITION_EMOJI[type] ?? '🌡️';
 }
 
+const DAY_NAMES = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+
+// Queries that should get the 5-day forecast rather than current conditions —
+// one compiled alternation, scanned once per query
+const FORECAST_INTENT = /\bforecast\b|\bweek\b|\btomorrow\b|\bnext\s+\d+\s+days?\b/i;
+
+// Fixed replies for the guard and error paths, built once at module load
+const MSG_NO_API_KEY = '🫘 Weather is unavailable — no Google API key configured.';
+const MSG_SLOW_UPSTREAM = '🫘 Weather is responding slowly right now. Try again in a moment.';
+const MSG_FETCH_FAILED = '🫘 Couldn\'t fetch weather data right now. Try again in a moment.';
+
 // ── Public API ───────────────────────────────────────────────────────
 
 /**
@@ -100,21 +145,22 @@ function conditionEmoji(type: string): string {
  */
 export async function handleWeather(query: string): Promise<string> {
   if (!config.GOOGLE_API_KEY) {
-    return '🫘 Weather is unavailable — no Google API key configured.';
+    return MSG_NO_API_KEY;
   }
 
   try {
     const location = await resolveLocation(query);
-    const wantsForecast = /\bforecast\b/i.test(query) || /\bweek\b/i.test(query)
-      || /\btomorrow\b/i.test(query) || /\bnext\s+\d+\s+days?\b/i.test(query);
-
-    if (wantsForecast) {
+    if (FORECAST_INTENT.test(query)) {
       return await getForecast(location);
     }
     return await getCurrentConditions(location);
   } catch (err) {
+    if (err instanceof Error && err.name === 'TimeoutError') {
+      logger.warn({ query, timeoutMs: TIMEOUT_MS }, 'Weather API request timed out');
+      return MSG_SLOW_UPSTREAM;
+    }
     logger.error({ err, query }, 'Weather feature error');
-    return '🫘 Couldn\'t fetch weather data right now. Try again in a moment.';
+    return MSG_FETCH_FAILED;
   }
 }
 
@@ -129,17 +175,41 @@ async function resolveLocation(query: string): Promise<Coords> {
 
   const place = locationMatch[1].trim();
 
-  // Short-circuit for Boston variants
-  if (/^boston/i.test(place)) return BOSTON;
+  // Known-place fast path before paying for a geocoding round-trip
+  const alias = LOCATION_ALIASES[locationKey(place)];
+  if (alias) return alias;
 
   // Geocode the location
   return await geocode(place);
 }
 
+// City coordinates don't move, so repeat queries for the same place skip the
+// geocoding round-trip entirely. Bounded Map used LRU-style: hits are
+// re-inserted to refresh recency, and the stalest entry is evicted at the cap.
+const GEOCODE_CACHE_MAX = 512;
+const geocodeCache = new Map<string, Coords>();
+
+/**
+ * Normalize a place string so "Tel  Aviv " and "tel aviv" share a cache slot.
+ * NFKC folds visually-identical Unicode spellings (composed vs decomposed
+ * accents, fullwidth letters) onto one key so non-ASCII city names match too.
+ */
+function locationKey(address: string): string {
+  return address.normalize('NFKC').trim().toLowerCase().replace(/\s+/g, ' ');
+}
+
 async function geocode(address: string): Promise<Coords> {
+  const key = locationKey(address);
+  const cached = geocodeCache.get(key);
+  if (cached) {
+    geocodeCache.delete(key);
+    geocodeCache.set(key, cached);
+    return cached;
+  }
+
   const url = `${GEOCODING_BASE}?address=${encodeURIComponent(address)}`;
 
-  const res = await fetch(url, { headers: googleApiHeaders(), signal: AbortSignal.timeout(TIMEOUT_MS) });
+  const res = await googleGet(url);
   if (!res.ok) {
     throw new Error(`Geocoding API error: ${res.status}`);
   }
@@ -148,65 +218,150 @@ async function geocode(address: string): Promise<Coords> {
 
   if (data.status !== 'OK' || !data.results.length) {
     logger.warn({ address, status: data.status }, 'Geocoding failed');
-    return BOSTON; // Fall back to Boston
+    return BOSTON; // Fall back to Boston — not cached, so a flaky lookup can recover
   }
 
   const result = data.results[0];
-  return {
+  const coords = {
     lat: result.geometry.location.lat,
     lng: result.geometry.location.lng,
     name: result.formatted_address.split(',')[0], // Just the city name
   };
+
+  if (geocodeCache.size >= GEOCODE_CACHE_MAX) {
+    const oldest = geocodeCache.keys().next().value;
+    if (oldest !== undefined) geocodeCache.delete(oldest);
+  }
+  geocodeCache.set(key, coords);
+  return coords;
+}
+
+// ── Response TTL cache ───────────────────────────────────────────────
+
+// Weather moves on minute-to-hour timescales, so identical queries inside a
+// short window reuse the last formatted reply instead of re-hitting Google.
+// Kept in memory rather than on disk: the bot is one long-lived process and
+// a restart just repays a single round-trip per location.
+const CURRENT_TTL_MS = 10 * 60 * 1000;
+const FORECAST_TTL_MS = 30 * 60 * 1000;
+const RESPONSE_CACHE_MAX = 256;
+const responseCache = new Map<string, { expiresAt: number; reply: string }>();
+
+/** Round coords to ~100 m so city-level queries collapse onto one entry */
+function responseCacheKey(kind: 'current' | 'forecast', location: Coords): string {
+  return `${kind}:${location.name}:${location.lat.toFixed(3)},${location.lng.toFixed(3)}`;
+}
+
+function getCachedReply(key: string): string | null {
+  const entry = responseCache.get(key);
+  if (!entry) return null;
+  if (Date.now() > entry.expiresAt) {
+    responseCache.delete(key);
+    return null;
+  }
+  return entry.reply;
+}
+
+function setCachedReply(key: string, reply: string, ttlMs: number): void {
+  if (responseCache.size >= RESPONSE_CACHE_MAX) {
+    const oldest = responseCache.keys().next().value;
+    if (oldest !== undefined) responseCache.delete(oldest);
+  }
+  responseCache.set(key, { expiresAt: Date.now() + ttlMs, reply });
 }
 
 // ── Current conditions ───────────────────────────────────────────────
 
+/** Flat, display-ready view of a current-conditions response */
+interface CurrentWeather {
+  emoji: string;
+  condition: string;
+  temp: number;
+  feelsLike: number;
+  humidity: number;
+  windSpeed: number;
+  windDir: string;
+  rainChance: number;
+  uvIndex: number;
+}
+
 async function getCurrentConditions(location: Coords): Promise<string> {
+  const cacheKey = responseCacheKey('current', location);
+  const cached = getCachedReply(cacheKey);
+  if (cached) return cached;
+
   const url = `${WEATHER_BASE}/currentConditions:lookup`
     + `?location.latitude=${location.lat}`
     + `&location.longitude=${location.lng}`
     + `&unitsSystem=IMPERIAL`;
 
-  const res = await fetch(url, { headers: googleApiHeaders(), signal: AbortSignal.timeout(TIMEOUT_MS) });
+  const res = await googleGet(url);
   if (!res.ok) {
-    const errText = await res.text();
+    // Error bodies can be large HTML pages; keep just enough to diagnose
+    const errText = (await res.text()).slice(0, 256);
     throw new Error(`Weather API error ${res.status}: ${errText}`);
   }
 
-  const data = CurrentConditionsSchema.parse(await res.json());
-
-  const emoji = conditionEmoji(data.weatherCondition.type);
-  const condition = data.weatherCondition.description.text;
-  const temp = Math.round(data.temperature.degrees);
-  const feelsLike = Math.round(data.feelsLikeTemperature.degrees);
-  const humidity = data.relativeHumidity;
-  const windSpeed = Math.round(data.wind.speed.value);
-  const windDir = formatCardinal(data.wind.direction.cardinal);
-  const rainChance = data.precipitation.probability.percent;
-
-  const lines = [
-    `${emoji} ${bold(`Weather in ${location.name}`)}`,
-    '',
-    `${bold(`${temp}°F`)} — ${condition}`,
-    `Feels like ${feelsLike}°F`,
-    `💧 Humidity: ${humidity}%`,
-    `💨 Wind: ${windSpeed} mph ${windDir}`,
-  ];
-
-  if (rainChance > 0) {
-    lines.push(`🌧️ Rain chance: ${rainChance}%`);
+  const current = extractCurrent(CurrentConditionsSchema.parse(await res.json()));
+  const reply = formatCurrent(current, location);
+  setCachedReply(cacheKey, reply, CURRENT_TTL_MS);
+  return reply;
+}
+
+/** Flatten the nested API shape into the fields the formatter needs */
+function extractCurrent(data: z.infer<typeof CurrentConditionsSchema>): CurrentWeather {
+  const { weatherCondition, wind, precipitation } = data;
+  return {
+    // Resolve the emoji here so formatting never re-derives it
+    emoji: conditionEmoji(weatherCondition.type),
+    condition: weatherCondition.description.text,
+    temp: Math.round(data.temperature.degrees),
+    feelsLike: Math.round(data.feelsLikeTemperature.degrees),
+    humidity: data.relativeHumidity,
+    windSpeed: Math.round(wind.speed.value),
+    windDir: formatCardinal(wind.direction.cardinal),
+    rainChance: precipitation.probability.percent,
+    uvIndex: data.uvIndex,
+  };
+}
+
+function formatCurrent(current: CurrentWeather, location: Coords): string {
+  // Fixed lines in one template; only the conditional tails append
+  let reply = `${current.emoji} ${bold(`Weather in ${location.name}`)}\n`
+    + `\n`
+    + `${bold(`${current.temp}°F`)} — ${current.condition}\n`
+    + `Feels like ${current.feelsLike}°F\n`
+    + `💧 Humidity: ${current.humidity}%\n`
+    + `💨 Wind: ${current.windSpeed} mph ${current.windDir}`;
+
+  if (current.rainChance > 0) {
+    reply += `\n🌧️ Rain chance: ${current.rainChance}%`;
   }
 
-  if (data.uvIndex >= 6) {
-    lines.push(`☀️ UV Index: ${data.uvIndex} — wear sunscreen!`);
+  if (current.uvIndex >= 6) {
+    reply += `\n☀️ UV Index: ${current.uvIndex} — wear sunscreen!`;
   }
 
-  return lines.join('\n');
+  return reply;
 }
 
 // ── Forecast ─────────────────────────────────────────────────────────
 
+/** Flat, display-ready view of one forecast day */
+interface ForecastDay {
+  dayName: string;
+  hi: number;
+  lo: number;
+  emoji: string;
+  condition: string;
+  rain: number;
+}
+
 async function getForecast(location: Coords): Promise<string> {
+  const cacheKey = responseCacheKey('forecast', location);
+  const cached = getCachedReply(cacheKey);
+  if (cached) return cached;
+
   const days = 5;
   const url = `${WEATHER_BASE}/forecast/days:lookup`
     + `?location.latitude=${location.lat}`
@@ -214,44 +369,59 @@ async function getForecast(location: Coords): Promise<string> {
     + `&unitsSystem=IMPERIAL`
     + `&days=${days}`;
 
-  const res = await fetch(url, { headers: googleApiHeaders(), signal: AbortSignal.timeout(TIMEOUT_MS) });
+  const res = await googleGet(url);
   if (!res.ok) {
-    const errText = await res.text();
+    // Error bodies can be large HTML pages; keep just enough to diagnose
+    const errText = (await res.text()).slice(0, 256);
     throw new Error(`Forecast API error ${res.status}: ${errText}`);
   }
 
   const data = ForecastResponseSchema.parse(await res.json());
+  const forecastDays = data.forecastDays.map(extractForecastDay);
+  const reply = formatForecast(forecastDays, days, location);
+  setCachedReply(cacheKey, reply, FORECAST_TTL_MS);
+  return reply;
+}
 
-  const lines = [`📅 ${bold(`${days}-Day Forecast for ${location.name}`)}`, ''];
-
-  const dayNames = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
-
-  for (const day of data.forecastDays) {
-    const date = new Date(day.displayDate.year, day.displayDate.month - 1, day.displayDate.day);
-    const dayName = dayNames[date.getDay()];
-    const hi = Math.round(day.maxTemperature.degrees);
-    const lo = Math.round(day.minTemperature.degrees);
-    const emoji = conditionEmoji(day.daytimeForecast.weatherCondition.type);
-    const condition = day.daytimeForecast.weatherCondition.description.text;
-    const rain = day.daytimeForecast.precipitation.probability.percent;
+/** Flatten the nested API shape into the fields the formatter needs */
+function extractForecastDay(day: z.infer<typeof ForecastDaySchema>): ForecastDay {
+  const date = new Date(day.displayDate.year, day.displayDate.month - 1, day.displayDate.day);
+  const { weatherCondition, precipitation } = day.daytimeForecast;
+  return {
+    dayName: DAY_NAMES[date.getDay()],
+    hi: Math.round(day.maxTemperature.degrees),
+    lo: Math.round(day.minTemperature.degrees),
+    emoji: conditionEmoji(weatherCondition.type),
+    condition: weatherCondition.description.text,
+    rain: precipitation.probability.percent,
+  };
+}
 
-    let line = `${emoji} ${bold(dayName)}: ${hi}°/${lo}° — ${condition}`;
-    if (rain > 20) {
-      line += ` (${rain}% rain)`;
-    }
-    lines.push(line);
-  }
+function formatForecast(forecastDays: ForecastDay[], days: number, location: Coords): string {
+  const dayLines = forecastDays.map((day) => {
+    const line = `${day.emoji} ${bold(day.dayName)}: ${day.hi}°/${day.lo}° — ${day.condition}`;
+    return day.rain > 20 ? `${line} (${day.rain}% rain)` : line;
+  });
 
-  return lines.join('\n');
+  return [`📅 ${bold(`${days}-Day Forecast for ${location.name}`)}`, '', ...dayLines].join('\n');
 }
 
 // ── Helpers ──────────────────────────────────────────────────────────
 
+// The API emits a bounded set of compass-point enums, so abbreviations are
+// computed once per distinct value and served from this map afterwards
+const cardinalAbbrev = new Map<string, string>();
+
 function formatCardinal(cardinal: string): string {
-  return cardinal
-    .replace(/_/g, '')
-    .replace(/NORTH/g, 'N')
-    .replace(/SOUTH/g, 'S')
-    .replace(/EAST/g, 'E')
-    .replace(/WEST/g, 'W');
+  let abbrev = cardinalAbbrev.get(cardinal);
+  if (abbrev === undefined) {
+    abbrev = cardinal
+      .replace(/_/g, '')
+      .replace(/NORTH/g, 'N')
+      .replace(/SOUTH/g, 'S')
+      .replace(/EAST/g, 'E')
+      .replace(/WEST/g, 'W');
+    cardinalAbbrev.set(cardinal, abbrev);
+  }
+  return abbrev;
 }
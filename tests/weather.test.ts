@@ -0,0 +1,211 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+
+process.env.OWNER_JID ??= 'test_owner@s.whatsapp.net';
+process.env.OPENROUTER_API_KEY ??= 'test_key_ci';
+process.env.AI_PROVIDER_ORDER ??= 'openrouter';
+
+const GEOCODE_RESPONSE = {
+  status: 'OK',
+  results: [
+    {
+      formatted_address: 'Somerville, MA, USA',
+      geometry: { location: { lat: 42.3876, lng: -71.0995 } },
+    },
+  ],
+};
+
+const CURRENT_RESPONSE = {
+  temperature: { degrees: 54.2, unit: 'FAHRENHEIT' },
+  feelsLikeTemperature: { degrees: 51.8, unit: 'FAHRENHEIT' },
+  weatherCondition: { description: { text: 'Partly cloudy' }, type: 'PARTLY_CLOUDY' },
+  relativeHumidity: 62,
+  wind: {
+    direction: { cardinal: 'NORTH_WEST' },
+    speed: { value: 12.4, unit: 'MILES_PER_HOUR' },
+  },
+  precipitation: { probability: { percent: 10, type: 'RAIN' } },
+  uvIndex: 2,
+  isDaytime: true,
+};
+
+const FORECAST_RESPONSE = {
+  forecastDays: [
+    {
+      displayDate: { year: 2026, month: 1, day: 10 },
+      maxTemperature: { degrees: 41.3, unit: 'FAHRENHEIT' },
+      minTemperature: { degrees: 28.9, unit: 'FAHRENHEIT' },
+      daytimeForecast: {
+        weatherCondition: { description: { text: 'Light snow' }, type: 'LIGHT_SNOW' },
+        precipitation: { probability: { percent: 55, type: 'SNOW' } },
+      },
+    },
+  ],
+};
+
+/** Route fetches by URL so one mock serves geocode, current, and forecast. */
+function mockWeatherFetch(): ReturnType<typeof vi.fn> {
+  const fetchMock = vi.fn(async (input: RequestInfo | URL) => {
+    const url = String(input);
+    if (url.includes('maps.googleapis.com')) {
+      return new Response(JSON.stringify(GEOCODE_RESPONSE));
+    }
+    if (url.includes('currentConditions')) {
+      return new Response(JSON.stringify(CURRENT_RESPONSE));
+    }
+    return new Response(JSON.stringify(FORECAST_RESPONSE));
+  });
+  vi.stubGlobal('fetch', fetchMock);
+  return fetchMock;
+}
+
+function mockWeatherDeps(options: { apiKey?: string | undefined } = {}) {
+  vi.doMock('../src/utils/config.js', () => ({
+    config: {
+      GOOGLE_API_KEY: 'apiKey' in options ? options.apiKey : 'test_key_xxx',
+    },
+  }));
+  vi.doMock('../src/middleware/logger.js', () => ({
+    logger: { info: vi.fn(), warn: vi.fn(), error: vi.fn(), debug: vi.fn() },
+  }));
+}
+
+describe('weather feature', () => {
+  beforeEach(() => {
+    vi.resetModules();
+    vi.restoreAllMocks();
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('returns a configuration notice when no API key is set', async () => {
+    mockWeatherDeps({ apiKey: undefined });
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather('weather?');
+    expect(reply).toContain('no Google API key');
+  });
+
+  it('defaults to Boston without a geocoding call', async () => {
+    mockWeatherDeps();
+    const fetchMock = mockWeatherFetch();
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather("what's the weather?");
+
+    expect(reply).toContain('Weather in Boston');
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(String(fetchMock.mock.calls[0]?.[0])).toContain('currentConditions');
+  });
+
+  it('formats current conditions from the API response', async () => {
+    mockWeatherDeps();
+    mockWeatherFetch();
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather('weather in Somerville');
+
+    expect(reply).toContain('Weather in Somerville');
+    expect(reply).toContain('*54°F* — Partly cloudy');
+    expect(reply).toContain('Feels like 52°F');
+    expect(reply).toContain('Wind: 12 mph NW');
+    expect(reply).toContain('Rain chance: 10%');
+    expect(reply).not.toContain('UV Index');
+  });
+
+  it('geocodes a non-Boston location once and caches it for repeat queries', async () => {
+    mockWeatherDeps();
+    const fetchMock = mockWeatherFetch();
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    await handleWeather('weather in Somerville');
+    await handleWeather('weather in  SOMERVILLE ');
+
+    const geocodeCalls = fetchMock.mock.calls
+      .filter((call) => String(call[0]).includes('maps.googleapis.com'));
+    expect(geocodeCalls).toHaveLength(1);
+  });
+
+  it('resolves Boston spelling variants from the alias table without geocoding', async () => {
+    mockWeatherDeps();
+    const fetchMock = mockWeatherFetch();
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather('weather in Boston, MA');
+
+    expect(reply).toContain('Weather in Boston');
+    const geocodeCalls = fetchMock.mock.calls
+      .filter((call) => String(call[0]).includes('maps.googleapis.com'));
+    expect(geocodeCalls).toHaveLength(0);
+  });
+
+  it('treats Unicode spelling variants of a place as the same cache entry', async () => {
+    mockWeatherDeps();
+    const fetchMock = mockWeatherFetch();
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    // Decomposed "Zürich" (u + combining diaeresis) vs composed "zürich"
+    await handleWeather('weather in Zu\u0308rich');
+    await handleWeather('weather in zürich');
+
+    const geocodeCalls = fetchMock.mock.calls
+      .filter((call) => String(call[0]).includes('maps.googleapis.com'));
+    expect(geocodeCalls).toHaveLength(1);
+  });
+
+  it('serves repeat current-conditions queries from the TTL cache', async () => {
+    vi.useFakeTimers();
+    try {
+      mockWeatherDeps();
+      const fetchMock = mockWeatherFetch();
+      const { handleWeather } = await import('../src/features/weather.js');
+
+      const first = await handleWeather("what's the weather?");
+      const second = await handleWeather("what's the weather?");
+
+      expect(second).toBe(first);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+
+      // Past the 10-minute TTL the next query re-fetches
+      vi.advanceTimersByTime(11 * 60 * 1000);
+      await handleWeather("what's the weather?");
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it('returns a forecast when the query asks for one', async () => {
+    mockWeatherDeps();
+    mockWeatherFetch();
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather('forecast this week');
+
+    expect(reply).toContain('5-Day Forecast for Boston');
+    expect(reply).toContain('*Sat*: 41°/29° — Light snow (55% rain)');
+  });
+
+  it('degrades with a slow-response notice when the request times out', async () => {
+    mockWeatherDeps();
+    vi.stubGlobal('fetch', vi.fn(async () => {
+      throw Object.assign(new Error('The operation was aborted due to timeout'), {
+        name: 'TimeoutError',
+      });
+    }));
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather("what's the weather?");
+    expect(reply).toContain('responding slowly');
+  });
+
+  it('returns the friendly fallback when the API errors', async () => {
+    mockWeatherDeps();
+    vi.stubGlobal('fetch', vi.fn(async () => new Response('boom', { status: 500 })));
+    const { handleWeather } = await import('../src/features/weather.js');
+
+    const reply = await handleWeather("what's the weather?");
+    expect(reply).toContain("Couldn't fetch weather data");
+  });
+});